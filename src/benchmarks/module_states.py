@@ -0,0 +1,55 @@
+"""Compare the per-cycle cost of SwerveDrive.drive against ModuleStateCache.drive on the dummy robot.
+
+Run from the src directory with `python -m benchmarks.module_states`.
+"""
+
+import math
+import timeit
+
+from wpimath.geometry import Translation2d
+
+from swervepy import SwerveDrive, TrajectoryFollowerParameters
+
+from config import switchable_options
+from config.global_options import OPEN_LOOP
+from module_state_cache import ModuleStateCache
+
+# Robot ID of the dummy option set, which needs no hardware
+DUMMY_ROBOT_ID = "4"
+
+CYCLES = 10_000
+
+
+def main():
+    options = switchable_options.resolve_options(DUMMY_ROBOT_ID)()
+    swerve = SwerveDrive(
+        options.MODULES,
+        options.GYRO,
+        options.MAX_VELOCITY,
+        options.MAX_ANGULAR_VELOCITY,
+        TrajectoryFollowerParameters(5, 5, OPEN_LOOP),
+    )
+    cache = ModuleStateCache([module.placement for module in options.MODULES])
+
+    # Held joystick: the same chassis speeds every cycle
+    held = Translation2d(2, 1)
+    # Moving joystick: new chassis speeds every cycle
+    moving = [Translation2d(2 * math.cos(i / 50), 2 * math.sin(i / 50)) for i in range(CYCLES)]
+
+    results = {
+        "drive, held": timeit.timeit(lambda: swerve.drive(held, 0.5, False, OPEN_LOOP), number=CYCLES),
+        "cache, held": timeit.timeit(lambda: cache.drive(swerve, held, 0.5, False, OPEN_LOOP), number=CYCLES),
+        "drive, moving": timeit.timeit(
+            lambda: [swerve.drive(translation, 0.5, False, OPEN_LOOP) for translation in moving], number=1
+        ),
+        "cache, moving": timeit.timeit(
+            lambda: [cache.drive(swerve, translation, 0.5, False, OPEN_LOOP) for translation in moving], number=1
+        ),
+    }
+
+    for name, total in results.items():
+        print(f"{name:<20} {total / CYCLES * 1e6:8.2f} us/cycle")
+
+
+if __name__ == "__main__":
+    main()
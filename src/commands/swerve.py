@@ -1,3 +1,5 @@
+from typing import Optional
+
 import commands2
 import wpimath.controller
 from wpimath.geometry import Rotation2d, Translation2d
@@ -6,6 +8,7 @@ from wpimath.kinematics import SwerveModuleState
 import swervepy
 
 from config.global_options import *
+from module_state_cache import ModuleStateCache
 
 
 def ski_stop_command(swerve: swervepy.SwerveDrive):
@@ -22,9 +25,17 @@ def ski_stop_command(swerve: swervepy.SwerveDrive):
 
 
 def drive_command(
-    swerve: swervepy.SwerveDrive, x_distance: float, y_distance: float, rotation: float, field_relative: bool = False
+    swerve: swervepy.SwerveDrive,
+    x_distance: float,
+    y_distance: float,
+    rotation: float,
+    field_relative: bool = False,
+    cache: Optional[ModuleStateCache] = None,
 ):
     translation = Translation2d(x_distance, y_distance)
+    if cache is not None:
+        # When robot-relative, the commanded speeds never change, so inverse kinematics only runs on the first cycle
+        return commands2.RunCommand(lambda: cache.drive(swerve, translation, rotation, field_relative, OPEN_LOOP))
     return commands2.RunCommand(lambda: swerve.drive(translation, rotation, field_relative, OPEN_LOOP))
 
 
@@ -43,7 +54,7 @@ class TurnCommand(commands2.Command):
         self.controller.setSetpoint(self.angle)
 
     def execute(self):
-        rotational_speed = self.controller.calculate(self.swerve.heading.degrees())
+        rotational_speed = self.controller.calculate(self.swerve.heading.radians())
         self.swerve.drive(Translation2d(0, 0), rotational_speed, False, OPEN_LOOP)
 
 
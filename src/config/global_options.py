@@ -4,3 +4,6 @@ OPEN_LOOP = True
 DRIVER_JOYSTICK = 0
 
 TURN_CMD_kP = 1
+
+# Seconds between dashboard telemetry updates
+DASHBOARD_PERIOD = 0.1
@@ -0,0 +1,62 @@
+"""Figure out which robot the code is running on.
+
+The robot ID is looked up in this order:
+1. The roboRIO's serial number in ROBOT_SERIALS
+2. A ROBOT_ID file kept on the roboRIO itself (ROBOT_ID_FILE), which survives redeploys
+3. The ROBOT_ID file written by deploy.bat/sim.bat
+"""
+
+from pathlib import Path
+from typing import Optional
+
+import wpilib
+
+# Dictionary of roboRIO serial numbers to robot IDs. The serial number is shown on the roboRIO web dashboard and
+# printed at boot when it is not in this dictionary
+ROBOT_SERIALS: dict[str, str] = {}
+
+# File kept in the home directory on the roboRIO. Deploying only replaces the py directory, so it persists
+ROBOT_ID_FILE = Path("/home/lvuser/ROBOT_ID")
+
+DEPLOYED_ROBOT_ID_FILE = Path(__file__).resolve().parent.parent / "ROBOT_ID"
+
+
+def _read_robot_id(path: Path) -> Optional[str]:
+    try:
+        tag = path.read_text().strip()
+    except OSError:
+        return None
+    return tag or None
+
+
+def get_serial_number() -> str:
+    """Return the roboRIO's serial number, or an empty string in simulation"""
+    if not wpilib.RobotBase.isReal():
+        return ""
+    return wpilib.RobotController.getSerialNumber()
+
+
+def detect_robot_id() -> str:
+    """Return the ID of the robot the code is running on"""
+    deployed_tag = _read_robot_id(DEPLOYED_ROBOT_ID_FILE)
+    serial = get_serial_number()
+
+    tag = None
+    if serial:
+        tag = ROBOT_SERIALS.get(serial) or _read_robot_id(ROBOT_ID_FILE)
+        if tag is None:
+            print(f"roboRIO serial number {serial} is not in ROBOT_SERIALS. Falling back to the deployed ROBOT_ID.")
+
+    if tag is None:
+        if deployed_tag is None:
+            raise Exception(
+                "Robot could not be identified and ROBOT_ID does not exist or is malformed. "
+                "Use deploy script with an argument to set ROBOT_ID."
+            )
+        return deployed_tag
+
+    # The robot's hardware identity wins over the deploy argument, but a mismatch is still worth pointing out
+    if deployed_tag is not None and deployed_tag != tag:
+        print(f"ROBOT_ID {deployed_tag} from deploy command does not match detected robot {tag}. Using {tag}.")
+
+    return tag
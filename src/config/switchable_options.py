@@ -1,7 +1,6 @@
 import copy
 import math
-from functools import cache
-from pathlib import Path
+from functools import cache, cached_property
 
 from swervepy import u
 from swervepy.impl import (
@@ -20,9 +19,11 @@ from swervepy.impl.motor import DummyCoaxialDriveComponent, DummyCoaxialAzimuthC
 from swervepy.impl.sensor import Pigeon2Gyro, DummyGyro
 from wpimath.geometry import Translation2d, Rotation2d
 
+from config import robot_identity
 
-def comp_2023():
-    class Inner:
+
+def comp_2023(base: type = object) -> type:
+    class Inner(base):
         TRACK_WIDTH = (24.75 * u.inch).m_as(u.m)
         WHEEL_BASE = (24.75 * u.inch).m_as(u.m)
         MAX_VELOCITY = 4 * (u.m / u.s)
@@ -60,36 +61,48 @@ def comp_2023():
             invert_motor=True,
         )
 
-        GYRO = PigeonGyro(0, False)
-
-        MODULES = (
-            CoaxialSwerveModule(
-                Falcon500CoaxialDriveComponent(4, DRIVE_PARAMS),
-                Falcon500CoaxialAzimuthComponent(3, Rotation2d.fromDegrees(0), AZIMUTH_PARAMS, AbsoluteCANCoder(0)),
-                Translation2d(WHEEL_BASE / 2, TRACK_WIDTH / 2),
-            ),
-            CoaxialSwerveModule(
-                Falcon500CoaxialDriveComponent(1, DRIVE_PARAMS),
-                Falcon500CoaxialAzimuthComponent(6, Rotation2d.fromDegrees(0), AZIMUTH_PARAMS, AbsoluteCANCoder(1)),
-                Translation2d(WHEEL_BASE / 2, -TRACK_WIDTH / 2),
-            ),
-            CoaxialSwerveModule(
-                Falcon500CoaxialDriveComponent(7, DRIVE_PARAMS),
-                Falcon500CoaxialAzimuthComponent(2, Rotation2d.fromDegrees(0), AZIMUTH_PARAMS, AbsoluteCANCoder(2)),
-                Translation2d(-WHEEL_BASE / 2, TRACK_WIDTH / 2),
-            ),
-            CoaxialSwerveModule(
-                Falcon500CoaxialDriveComponent(5, DRIVE_PARAMS),
-                Falcon500CoaxialAzimuthComponent(0, Rotation2d.fromDegrees(0), AZIMUTH_PARAMS, AbsoluteCANCoder(3)),
-                Translation2d(-WHEEL_BASE / 2, -TRACK_WIDTH / 2),
-            ),
-        )
+        @cached_property
+        def GYRO(self):
+            return PigeonGyro(0, False)
+
+        @cached_property
+        def MODULES(self):
+            return (
+                CoaxialSwerveModule(
+                    Falcon500CoaxialDriveComponent(4, self.DRIVE_PARAMS),
+                    Falcon500CoaxialAzimuthComponent(
+                        3, Rotation2d.fromDegrees(0), self.AZIMUTH_PARAMS, AbsoluteCANCoder(0)
+                    ),
+                    Translation2d(self.WHEEL_BASE / 2, self.TRACK_WIDTH / 2),
+                ),
+                CoaxialSwerveModule(
+                    Falcon500CoaxialDriveComponent(1, self.DRIVE_PARAMS),
+                    Falcon500CoaxialAzimuthComponent(
+                        6, Rotation2d.fromDegrees(0), self.AZIMUTH_PARAMS, AbsoluteCANCoder(1)
+                    ),
+                    Translation2d(self.WHEEL_BASE / 2, -self.TRACK_WIDTH / 2),
+                ),
+                CoaxialSwerveModule(
+                    Falcon500CoaxialDriveComponent(7, self.DRIVE_PARAMS),
+                    Falcon500CoaxialAzimuthComponent(
+                        2, Rotation2d.fromDegrees(0), self.AZIMUTH_PARAMS, AbsoluteCANCoder(2)
+                    ),
+                    Translation2d(-self.WHEEL_BASE / 2, self.TRACK_WIDTH / 2),
+                ),
+                CoaxialSwerveModule(
+                    Falcon500CoaxialDriveComponent(5, self.DRIVE_PARAMS),
+                    Falcon500CoaxialAzimuthComponent(
+                        0, Rotation2d.fromDegrees(0), self.AZIMUTH_PARAMS, AbsoluteCANCoder(3)
+                    ),
+                    Translation2d(-self.WHEEL_BASE / 2, -self.TRACK_WIDTH / 2),
+                ),
+            )
 
-    return Inner()
+    return Inner
 
 
-def dev_2024():
-    class Inner:
+def dev_2024(base: type = object) -> type:
+    class Inner(base):
         TRACK_WIDTH = (24.75 * u.inch).m_as(u.m)
         WHEEL_BASE = (24.75 * u.inch).m_as(u.m)
         MAX_VELOCITY = 4 * (u.m / u.s)  # TODO: Measure
@@ -127,36 +140,48 @@ def dev_2024():
             invert_motor=True,
         )
 
-        GYRO = Pigeon2Gyro(0, False)
-
-        MODULES = (
-            CoaxialSwerveModule(
-                NEOCoaxialDriveComponent(1, DRIVE_PARAMS),
-                NEOCoaxialAzimuthComponent(2, Rotation2d.fromDegrees(107.226562), AZIMUTH_PARAMS, AbsoluteCANCoder(1)),
-                Translation2d(WHEEL_BASE / 2, TRACK_WIDTH / 2),
-            ),
-            CoaxialSwerveModule(
-                NEOCoaxialDriveComponent(3, DRIVE_PARAMS),
-                NEOCoaxialAzimuthComponent(4, Rotation2d.fromDegrees(160.136719), AZIMUTH_PARAMS, AbsoluteCANCoder(2)),
-                Translation2d(WHEEL_BASE / 2, -TRACK_WIDTH / 2),
-            ),
-            CoaxialSwerveModule(
-                NEOCoaxialDriveComponent(5, DRIVE_PARAMS),
-                NEOCoaxialAzimuthComponent(6, Rotation2d.fromDegrees(307.089844), AZIMUTH_PARAMS, AbsoluteCANCoder(3)),
-                Translation2d(-WHEEL_BASE / 2, TRACK_WIDTH / 2),
-            ),
-            CoaxialSwerveModule(
-                NEOCoaxialDriveComponent(7, DRIVE_PARAMS),
-                NEOCoaxialAzimuthComponent(8, Rotation2d.fromDegrees(355.693359), AZIMUTH_PARAMS, AbsoluteCANCoder(4)),
-                Translation2d(-WHEEL_BASE / 2, -TRACK_WIDTH / 2),
-            ),
-        )
+        @cached_property
+        def GYRO(self):
+            return Pigeon2Gyro(0, False)
+
+        @cached_property
+        def MODULES(self):
+            return (
+                CoaxialSwerveModule(
+                    NEOCoaxialDriveComponent(1, self.DRIVE_PARAMS),
+                    NEOCoaxialAzimuthComponent(
+                        2, Rotation2d.fromDegrees(107.226562), self.AZIMUTH_PARAMS, AbsoluteCANCoder(1)
+                    ),
+                    Translation2d(self.WHEEL_BASE / 2, self.TRACK_WIDTH / 2),
+                ),
+                CoaxialSwerveModule(
+                    NEOCoaxialDriveComponent(3, self.DRIVE_PARAMS),
+                    NEOCoaxialAzimuthComponent(
+                        4, Rotation2d.fromDegrees(160.136719), self.AZIMUTH_PARAMS, AbsoluteCANCoder(2)
+                    ),
+                    Translation2d(self.WHEEL_BASE / 2, -self.TRACK_WIDTH / 2),
+                ),
+                CoaxialSwerveModule(
+                    NEOCoaxialDriveComponent(5, self.DRIVE_PARAMS),
+                    NEOCoaxialAzimuthComponent(
+                        6, Rotation2d.fromDegrees(307.089844), self.AZIMUTH_PARAMS, AbsoluteCANCoder(3)
+                    ),
+                    Translation2d(-self.WHEEL_BASE / 2, self.TRACK_WIDTH / 2),
+                ),
+                CoaxialSwerveModule(
+                    NEOCoaxialDriveComponent(7, self.DRIVE_PARAMS),
+                    NEOCoaxialAzimuthComponent(
+                        8, Rotation2d.fromDegrees(355.693359), self.AZIMUTH_PARAMS, AbsoluteCANCoder(4)
+                    ),
+                    Translation2d(-self.WHEEL_BASE / 2, -self.TRACK_WIDTH / 2),
+                ),
+            )
 
-    return Inner()
+    return Inner
 
 
-def demo_1():
-    class Inner:
+def demo_1(base: type = object) -> type:
+    class Inner(base):
         TRACK_WIDTH = (18.75 * u.inch).m_as(u.m)
         WHEEL_BASE = (18.75 * u.inch).m_as(u.m)
         MAX_VELOCITY = 4 * (u.m / u.s)
@@ -194,75 +219,52 @@ def demo_1():
             invert_motor=True,
         )
 
-        GYRO = DummyGyro(0, False)
-
-        MODULES = [
-            CoaxialSwerveModule(
-                NEOCoaxialDriveComponent(1, DRIVE_PARAMS),
-                NEOCoaxialAzimuthComponent(2, Rotation2d.fromDegrees(224.208984), AZIMUTH_PARAMS, AbsoluteCANCoder(1)),
-                Translation2d(WHEEL_BASE / 2, TRACK_WIDTH / 2),
-            ),
-            CoaxialSwerveModule(
-                NEOCoaxialDriveComponent(3, DRIVE_PARAMS),
-                NEOCoaxialAzimuthComponent(4, Rotation2d.fromDegrees(72.861328), AZIMUTH_PARAMS, AbsoluteCANCoder(2)),
-                Translation2d(WHEEL_BASE / 2, -TRACK_WIDTH / 2),
-            ),
-            CoaxialSwerveModule(
-                NEOCoaxialDriveComponent(5, DRIVE_PARAMS),
-                NEOCoaxialAzimuthComponent(6, Rotation2d.fromDegrees(97.294922), AZIMUTH_PARAMS, AbsoluteCANCoder(3)),
-                Translation2d(-WHEEL_BASE / 2, TRACK_WIDTH / 2),
-            ),
-            CoaxialSwerveModule(
-                NEOCoaxialDriveComponent(7, DRIVE_PARAMS),
-                NEOCoaxialAzimuthComponent(8, Rotation2d.fromDegrees(312.451172), AZIMUTH_PARAMS, AbsoluteCANCoder(4)),
-                Translation2d(-WHEEL_BASE / 2, -TRACK_WIDTH / 2),
-            ),
-        ]
-
-    return Inner()
-
-
-def demo_2():
-    class Inner:
-        TRACK_WIDTH = (18.75 * u.inch).m_as(u.m)
-        WHEEL_BASE = (18.75 * u.inch).m_as(u.m)
-        MAX_VELOCITY = 4 * (u.m / u.s)
-        MAX_ANGULAR_VELOCITY = 584 * (u.deg / u.s)
+        @cached_property
+        def GYRO(self):
+            return DummyGyro(0, False)
+
+        @cached_property
+        def MODULES(self):
+            return [
+                CoaxialSwerveModule(
+                    NEOCoaxialDriveComponent(1, self.DRIVE_PARAMS),
+                    NEOCoaxialAzimuthComponent(
+                        2, Rotation2d.fromDegrees(224.208984), self.AZIMUTH_PARAMS, AbsoluteCANCoder(1)
+                    ),
+                    Translation2d(self.WHEEL_BASE / 2, self.TRACK_WIDTH / 2),
+                ),
+                CoaxialSwerveModule(
+                    NEOCoaxialDriveComponent(3, self.DRIVE_PARAMS),
+                    NEOCoaxialAzimuthComponent(
+                        4, Rotation2d.fromDegrees(72.861328), self.AZIMUTH_PARAMS, AbsoluteCANCoder(2)
+                    ),
+                    Translation2d(self.WHEEL_BASE / 2, -self.TRACK_WIDTH / 2),
+                ),
+                CoaxialSwerveModule(
+                    NEOCoaxialDriveComponent(5, self.DRIVE_PARAMS),
+                    NEOCoaxialAzimuthComponent(
+                        6, Rotation2d.fromDegrees(97.294922), self.AZIMUTH_PARAMS, AbsoluteCANCoder(3)
+                    ),
+                    Translation2d(-self.WHEEL_BASE / 2, self.TRACK_WIDTH / 2),
+                ),
+                CoaxialSwerveModule(
+                    NEOCoaxialDriveComponent(7, self.DRIVE_PARAMS),
+                    NEOCoaxialAzimuthComponent(
+                        8, Rotation2d.fromDegrees(312.451172), self.AZIMUTH_PARAMS, AbsoluteCANCoder(4)
+                    ),
+                    Translation2d(-self.WHEEL_BASE / 2, -self.TRACK_WIDTH / 2),
+                ),
+            ]
 
-        DRIVE_PARAMS = TypicalDriveComponentParameters(
-            wheel_circumference=4 * math.pi * u.inch,
-            gear_ratio=6.75 / 1,  # SDS Mk4i L2
-            max_speed=MAX_VELOCITY,
-            open_loop_ramp_rate=0.25,
-            closed_loop_ramp_rate=0,
-            continuous_current_limit=40,
-            peak_current_limit=60,
-            peak_current_duration=0.01,
-            neutral_mode=NeutralMode.COAST,
-            kP=0.1,
-            kI=0,
-            kD=0,
-            kS=0,
-            kV=0,
-            kA=0,
-            invert_motor=True,
-        )
-        NEO_AZIMUTH_PARAMS = TypicalAzimuthComponentParameters(
-            gear_ratio=150 / 7,  # SDS Mk4i
-            max_angular_velocity=MAX_ANGULAR_VELOCITY,
-            ramp_rate=0,
-            continuous_current_limit=25,
-            peak_current_limit=40,
-            peak_current_duration=0.01,
-            neutral_mode=NeutralMode.BRAKE,
-            kP=0.01,
-            kI=0,
-            kD=0,
-            invert_motor=True,
-        )
+    return Inner
+
+
+def demo_2(base: type) -> type:
+    # Inherits from demo_1. Only the differences are declared here
+    class Inner(base):
         FALCON_AZIMUTH_PARAMS = TypicalAzimuthComponentParameters(
             gear_ratio=150 / 7,  # SDS Mk4i
-            max_angular_velocity=MAX_ANGULAR_VELOCITY,
+            max_angular_velocity=base.MAX_ANGULAR_VELOCITY,
             ramp_rate=0,
             continuous_current_limit=25,
             peak_current_limit=40,
@@ -274,101 +276,112 @@ def demo_2():
             invert_motor=True,
         )
 
-        GYRO = Pigeon2Gyro(0, False)
-
-        MODULES = [
-            CoaxialSwerveModule(
-                NEOCoaxialDriveComponent(1, DRIVE_PARAMS),
-                NEOCoaxialAzimuthComponent(
-                    2, Rotation2d.fromDegrees(314.6484375), NEO_AZIMUTH_PARAMS, AbsoluteCANCoder(1)
+        @cached_property
+        def GYRO(self):
+            return Pigeon2Gyro(0, False)
+
+        @cached_property
+        def MODULES(self):
+            return [
+                CoaxialSwerveModule(
+                    NEOCoaxialDriveComponent(1, self.DRIVE_PARAMS),
+                    NEOCoaxialAzimuthComponent(
+                        2, Rotation2d.fromDegrees(314.6484375), self.AZIMUTH_PARAMS, AbsoluteCANCoder(1)
+                    ),
+                    Translation2d(self.WHEEL_BASE / 2, self.TRACK_WIDTH / 2),
                 ),
-                Translation2d(WHEEL_BASE / 2, TRACK_WIDTH / 2),
-            ),
-            CoaxialSwerveModule(
-                NEOCoaxialDriveComponent(3, DRIVE_PARAMS),
-                Falcon500CoaxialAzimuthComponent(
-                    2, Rotation2d.fromDegrees(62.666015625), FALCON_AZIMUTH_PARAMS, AbsoluteCANCoder(2)
+                CoaxialSwerveModule(
+                    NEOCoaxialDriveComponent(3, self.DRIVE_PARAMS),
+                    Falcon500CoaxialAzimuthComponent(
+                        2, Rotation2d.fromDegrees(62.666015625), self.FALCON_AZIMUTH_PARAMS, AbsoluteCANCoder(2)
+                    ),
+                    Translation2d(self.WHEEL_BASE / 2, -self.TRACK_WIDTH / 2),
                 ),
-                Translation2d(WHEEL_BASE / 2, -TRACK_WIDTH / 2),
-            ),
-            CoaxialSwerveModule(
-                NEOCoaxialDriveComponent(5, DRIVE_PARAMS),
-                NEOCoaxialAzimuthComponent(
-                    6, Rotation2d.fromDegrees(151.5234375), NEO_AZIMUTH_PARAMS, AbsoluteCANCoder(3)
+                CoaxialSwerveModule(
+                    NEOCoaxialDriveComponent(5, self.DRIVE_PARAMS),
+                    NEOCoaxialAzimuthComponent(
+                        6, Rotation2d.fromDegrees(151.5234375), self.AZIMUTH_PARAMS, AbsoluteCANCoder(3)
+                    ),
+                    Translation2d(-self.WHEEL_BASE / 2, self.TRACK_WIDTH / 2),
                 ),
-                Translation2d(-WHEEL_BASE / 2, TRACK_WIDTH / 2),
-            ),
-            CoaxialSwerveModule(
-                NEOCoaxialDriveComponent(7, DRIVE_PARAMS),
-                NEOCoaxialAzimuthComponent(
-                    8, Rotation2d.fromDegrees(34.98046875), NEO_AZIMUTH_PARAMS, AbsoluteCANCoder(4)
+                CoaxialSwerveModule(
+                    NEOCoaxialDriveComponent(7, self.DRIVE_PARAMS),
+                    NEOCoaxialAzimuthComponent(
+                        8, Rotation2d.fromDegrees(34.98046875), self.AZIMUTH_PARAMS, AbsoluteCANCoder(4)
+                    ),
+                    Translation2d(-self.WHEEL_BASE / 2, -self.TRACK_WIDTH / 2),
                 ),
-                Translation2d(-WHEEL_BASE / 2, -TRACK_WIDTH / 2),
-            ),
-        ]
+            ]
 
-    return Inner()
+    return Inner
 
 
-def dummy():
-    class Inner:
+def dummy(base: type = object) -> type:
+    class Inner(base):
         TRACK_WIDTH = (24.75 * u.inch).m_as(u.m)
         WHEEL_BASE = (24.75 * u.inch).m_as(u.m)
         MAX_VELOCITY = 4 * (u.m / u.s)
         MAX_ANGULAR_VELOCITY = 584 * (u.deg / u.s)
 
-        GYRO = DummyGyro()
-
-        MODULES = (
-            CoaxialSwerveModule(
-                DummyCoaxialDriveComponent(),
-                DummyCoaxialAzimuthComponent(),
-                Translation2d(WHEEL_BASE / 2, TRACK_WIDTH / 2),
-            ),
-            CoaxialSwerveModule(
-                DummyCoaxialDriveComponent(),
-                DummyCoaxialAzimuthComponent(),
-                Translation2d(WHEEL_BASE / 2, -TRACK_WIDTH / 2),
-            ),
-            CoaxialSwerveModule(
-                DummyCoaxialDriveComponent(),
-                DummyCoaxialAzimuthComponent(),
-                Translation2d(-WHEEL_BASE / 2, TRACK_WIDTH / 2),
-            ),
-            CoaxialSwerveModule(
-                DummyCoaxialDriveComponent(),
-                DummyCoaxialAzimuthComponent(),
-                Translation2d(-WHEEL_BASE / 2, -TRACK_WIDTH / 2),
-            ),
-        )
+        @cached_property
+        def GYRO(self):
+            return DummyGyro()
+
+        @cached_property
+        def MODULES(self):
+            return (
+                CoaxialSwerveModule(
+                    DummyCoaxialDriveComponent(),
+                    DummyCoaxialAzimuthComponent(),
+                    Translation2d(self.WHEEL_BASE / 2, self.TRACK_WIDTH / 2),
+                ),
+                CoaxialSwerveModule(
+                    DummyCoaxialDriveComponent(),
+                    DummyCoaxialAzimuthComponent(),
+                    Translation2d(self.WHEEL_BASE / 2, -self.TRACK_WIDTH / 2),
+                ),
+                CoaxialSwerveModule(
+                    DummyCoaxialDriveComponent(),
+                    DummyCoaxialAzimuthComponent(),
+                    Translation2d(-self.WHEEL_BASE / 2, self.TRACK_WIDTH / 2),
+                ),
+                CoaxialSwerveModule(
+                    DummyCoaxialDriveComponent(),
+                    DummyCoaxialAzimuthComponent(),
+                    Translation2d(-self.WHEEL_BASE / 2, -self.TRACK_WIDTH / 2),
+                ),
+            )
 
-    return Inner()
+    return Inner
 
 
-# Dictionary of robot ID values possible in the ROBOT_ID file. Each key's value is a function that returns a class of
-# constants
+# Dictionary of robot ID values. Each key's value is a function that returns a class of constants, and the ID of the
+# option set that class inherits from (or None). Hardware (GYRO, MODULES) is only constructed when first accessed, so
+# inheriting from another option set never touches that robot's devices
 OPTIONS = {
-    "0": comp_2023,
-    "1": dev_2024,
-    "2": demo_1,
-    "3": demo_2,
-    "4": dummy,
+    "0": (comp_2023, None),
+    "1": (dev_2024, None),
+    "2": (demo_1, None),
+    "3": (demo_2, "2"),
+    "4": (dummy, None),
 }
 
 
 @cache
-def get_robot_specific_options():
-    # Load robot identifier from file
-    try:
-        with open(Path(__file__).resolve().parent.parent / "ROBOT_ID", "r") as f:
-            tag = f.read().strip()
-    except OSError:
-        raise Exception("ROBOT_ID does not exist or is malformed. Use deploy script with an argument to set ROBOT_ID.")
-
-    # Pick options from robot ID
+def resolve_options(tag: str) -> type:
+    """Build the class of constants for a robot ID, including everything it inherits"""
     try:
-        options = OPTIONS[tag]
+        options, parent = OPTIONS[tag]
     except KeyError:
-        raise Exception(f"Robot ID {tag} in deploy command does not have a matching option set in code.")
+        raise Exception(f"Robot ID {tag} does not have a matching option set in code.")
+
+    base = resolve_options(parent) if parent is not None else object
+    return options(base)
+
+
+@cache
+def get_robot_specific_options():
+    # Identify the robot from its hardware, falling back to the ROBOT_ID file written by the deploy script
+    tag = robot_identity.detect_robot_id()
 
-    return options()
+    return resolve_options(tag)()
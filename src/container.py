@@ -11,6 +11,8 @@ from pathplannerlib.path import PathPlannerPath
 from config import switchable_options
 from commands.swerve import ski_stop_command
 from config.global_options import *
+from dashboard import DashboardPublisher
+from module_state_cache import ModuleStateCache
 from oi import XboxDriver, PS4Driver
 
 
@@ -22,7 +24,7 @@ class RobotContainer:
         self.stick = PS4Driver(DRIVER_JOYSTICK)
 
         # Load configs for the specific robot this code is deployed to
-        # Determined by a value set in the ROBOT_ID file
+        # Determined by the roboRIO's identity, or a value set in the ROBOT_ID file (see config/robot_identity.py)
         self.options = switchable_options.get_robot_specific_options()
 
         # Construct the swerve drivetrain
@@ -34,6 +36,9 @@ class RobotContainer:
             TrajectoryFollowerParameters(5, 5, OPEN_LOOP),
         )
 
+        # Lets fixed-speed commands like drive_command skip inverse kinematics (see module_state_cache.py)
+        self.module_state_cache = ModuleStateCache([module.placement for module in self.options.MODULES])
+
         self.teleop_command = self.swerve.teleop_command(
             self.stick.forward,
             self.stick.strafe,
@@ -46,6 +51,9 @@ class RobotContainer:
         self.swerve.setDefaultCommand(self.teleop_command)
         wpilib.SmartDashboard.putData(self.teleop_command)
 
+        # Swerve telemetry is sent from a background thread at DASHBOARD_PERIOD
+        self.dashboard = DashboardPublisher(self.swerve, DASHBOARD_PERIOD)
+
         self.configure_button_bindings()
 
         # Load PathPlanner autos
@@ -0,0 +1,137 @@
+"""Publish drivetrain telemetry to NetworkTables without slowing down the main robot loop.
+
+The main loop records its timing every cycle but only takes a snapshot of the other values every DASHBOARD_PERIOD
+seconds. Loop timing is sent as the max and mean over all cycles since the previous snapshot. A background thread sends
+each snapshot through publishers that are created once at startup, skipping any topic whose value did not change since
+it was last sent.
+"""
+
+import threading
+from typing import Any, Optional
+
+import ntcore
+import wpilib
+from wpimath.geometry import Pose2d
+from wpimath.kinematics import SwerveModuleState
+
+import swervepy
+
+
+class DashboardPublisher:
+    def __init__(self, swerve: swervepy.SwerveDrive, period: float, table: str = "Swerve"):
+        """Construct a DashboardPublisher and start its background thread
+
+        :param swerve: The drivetrain to report on
+        :param period: How often to send new values, in seconds. Should be longer than the 20 ms robot loop
+        :param table: Name of the SmartDashboard subtable to publish under
+        """
+        self.swerve = swerve
+        self.period = period
+
+        nt = ntcore.NetworkTableInstance.getDefault().getTable("SmartDashboard").getSubTable(table)
+        self._publishers = {
+            "module_states": nt.getStructArrayTopic("Module States", SwerveModuleState).publish(),
+            "pose": nt.getStructTopic("Pose", Pose2d).publish(),
+            "loop_time_max": nt.getDoubleTopic("Loop Time Max (ms)").publish(),
+            "loop_time_mean": nt.getDoubleTopic("Loop Time Mean (ms)").publish(),
+            "robot_period_max": nt.getDoubleTopic("Robot Period Max (ms)").publish(),
+            "command": nt.getStringTopic("Current Command").publish(),
+        }
+        self._last_sent: dict[str, Any] = {}
+
+        self._lock = threading.Lock()
+        self._snapshot: Optional[dict[str, Any]] = None
+        self._new_snapshot = threading.Event()
+        self._idle = threading.Event()
+        self._idle.set()
+        self._stopped = threading.Event()
+
+        self._next_sample = 0.0
+        self._last_update: Optional[float] = None
+
+        # Timing of every cycle since the last snapshot, so no overrun is missed between snapshots
+        self._loop_time_max = 0.0
+        self._loop_time_total = 0.0
+        self._robot_period_max = 0.0
+        self._cycles = 0
+
+        self._thread = threading.Thread(target=self._run, name="DashboardPublisher", daemon=True)
+        self._thread.start()
+
+    def update(self, loop_time: float):
+        """Take a snapshot of the drivetrain if one is due. Call once per robot loop
+
+        :param loop_time: How long this cycle's periodic work took, in seconds
+        """
+        now = wpilib.Timer.getFPGATimestamp()
+        robot_period = now - self._last_update if self._last_update is not None else 0
+        self._last_update = now
+
+        self._loop_time_max = max(self._loop_time_max, loop_time)
+        self._loop_time_total += loop_time
+        self._robot_period_max = max(self._robot_period_max, robot_period)
+        self._cycles += 1
+
+        # FPGA time is in whole microseconds, so allow for rounding when comparing against the schedule
+        if now + 1e-6 < self._next_sample:
+            return
+        self._next_sample += self.period
+        if self._next_sample <= now:
+            # First snapshot, or the loop stalled for more than a period. Restart the schedule from now
+            self._next_sample = now + self.period
+
+        command = self.swerve.getCurrentCommand()
+        snapshot = {
+            "module_states": list(self.swerve.module_states),
+            "pose": self.swerve.pose,
+            "loop_time_max": self._loop_time_max * 1000,
+            "loop_time_mean": self._loop_time_total / self._cycles * 1000,
+            "robot_period_max": self._robot_period_max * 1000,
+            "command": command.getName() if command is not None else "None",
+        }
+
+        self._loop_time_max = 0.0
+        self._loop_time_total = 0.0
+        self._robot_period_max = 0.0
+        self._cycles = 0
+
+        with self._lock:
+            self._snapshot = snapshot
+            self._idle.clear()
+        self._new_snapshot.set()
+
+    def wait_until_sent(self, timeout: Optional[float] = None) -> bool:
+        """Wait for the background thread to send the latest snapshot
+
+        :param timeout: How long to wait, in seconds. Waits forever if None
+        :return: True if everything was sent, False if the timeout expired first
+        """
+        return self._idle.wait(timeout)
+
+    def stop(self):
+        """Stop the background thread and unpublish all topics"""
+        self._stopped.set()
+        self._new_snapshot.set()
+        self._thread.join()
+
+        for publisher in self._publishers.values():
+            publisher.close()
+
+    def _run(self):
+        while not self._stopped.is_set():
+            self._new_snapshot.wait()
+            self._new_snapshot.clear()
+
+            with self._lock:
+                snapshot, self._snapshot = self._snapshot, None
+            if snapshot is not None:
+                for key, value in snapshot.items():
+                    # Only send values that changed
+                    if self._last_sent.get(key) == value:
+                        continue
+                    self._publishers[key].set(value)
+                    self._last_sent[key] = value
+
+            with self._lock:
+                if self._snapshot is None:
+                    self._idle.set()
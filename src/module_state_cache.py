@@ -0,0 +1,60 @@
+"""Skip inverse kinematics when the commanded chassis speeds have not changed since the last cycle.
+
+`SwerveDrive.drive` converts chassis speeds to module states every cycle. A command that asks for the same speeds
+cycle after cycle (e.g. driving robot-relative at a fixed speed) can reuse the module states from the previous cycle
+instead. swervepy still desaturates and optimizes each module state in `desire_module_states`, exactly as it does for
+`SwerveDrive.drive`, so a cache hit does strictly less work and a miss does the same work.
+
+Run `python -m benchmarks.module_states` from the src directory to compare its cost against `SwerveDrive.drive`.
+"""
+
+from typing import Optional, Sequence
+
+from wpimath.geometry import Translation2d
+from wpimath.kinematics import ChassisSpeeds, SwerveDrive4Kinematics, SwerveModuleState
+
+import swervepy
+
+
+class ModuleStateCache:
+    """Turn chassis speeds into module states, reusing the last result when the speeds are unchanged"""
+
+    def __init__(self, placements: Sequence[Translation2d]):
+        """Construct a ModuleStateCache
+
+        :param placements: The location of each module relative to the center of the robot, in meters
+        """
+        self._kinematics = SwerveDrive4Kinematics(*placements)
+
+        self._last_speeds: Optional[tuple[float, float, float]] = None
+        self._states: tuple[SwerveModuleState, ...] = ()
+
+    def calculate(self, speeds: ChassisSpeeds) -> tuple[SwerveModuleState, ...]:
+        """Get the module states for the given robot-relative chassis speeds"""
+        key = (speeds.vx, speeds.vy, speeds.omega)
+        if key != self._last_speeds:
+            self._states = tuple(self._kinematics.toSwerveModuleStates(speeds))
+            self._last_speeds = key
+
+        return self._states
+
+    def drive(
+        self,
+        swerve: swervepy.SwerveDrive,
+        translation: Translation2d,
+        rotation: float,
+        field_relative: bool,
+        open_loop: bool,
+    ):
+        """Drive the robot, like `SwerveDrive.drive`, reusing the previous cycle's module states when possible
+
+        Field-relative speeds are rotated by the heading every cycle, so they only hit the cache while the robot's
+        heading is unchanged.
+        """
+        if field_relative:
+            speeds = ChassisSpeeds.fromFieldRelativeSpeeds(translation.x, translation.y, rotation, swerve.heading)
+        else:
+            speeds = ChassisSpeeds(translation.x, translation.y, rotation)
+
+        # Like SwerveDrive.drive, don't turn modules that are barely moving, to prevent jittering
+        swerve.desire_module_states(self.calculate(speeds), open_loop, rotate_in_place=False)
@@ -13,6 +13,11 @@ class Robot(commands2.TimedCommandRobot):
         self.autonomous_command: Optional[commands2.Command] = None
         self.test_command: Optional[commands2.Command] = None
 
+    def robotPeriodic(self) -> None:
+        start = wpilib.Timer.getFPGATimestamp()
+        super().robotPeriodic()
+        self.container.dashboard.update(wpilib.Timer.getFPGATimestamp() - start)
+
     def autonomousInit(self) -> None:
         self.autonomous_command = self.container.get_autonomous_command()
         if self.autonomous_command:
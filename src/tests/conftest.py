@@ -0,0 +1,46 @@
+"""Fixtures for tests that run robot code in simulation.
+
+Run the tests from the src directory with `python -m pytest`. Each test builds its own RobotContainer, so they can run
+in parallel across processes with pytest-xdist, listed in requirements-dev.txt: `python -m pytest -n auto`.
+"""
+
+import commands2
+import hal
+import pytest
+import wpilib
+from wpilib.simulation import DriverStationSim, SimHooks
+
+from config import robot_identity, switchable_options
+from sim_harness import LockstepSim, refresh_driver_station
+
+# Robot ID of the dummy option set, which needs no hardware
+DUMMY_ROBOT_ID = "4"
+
+
+@pytest.fixture
+def driver_station():
+    """Simulated, paused Driver Station with no controller inputs"""
+    hal.initialize()
+    wpilib.DriverStation.silenceJoystickConnectionWarning(True)
+    SimHooks.pauseTiming()
+    DriverStationSim.resetData()
+    refresh_driver_station()
+
+    yield
+
+    SimHooks.resumeTiming()
+
+
+@pytest.fixture
+def sim(driver_station, monkeypatch):
+    """RobotContainer for the dummy robot, enabled in teleop"""
+    monkeypatch.setattr(robot_identity, "detect_robot_id", lambda: DUMMY_ROBOT_ID)
+    switchable_options.get_robot_specific_options.cache_clear()
+    commands2.CommandScheduler.resetInstance()
+
+    harness = LockstepSim()
+    yield harness
+    harness.close()
+
+    commands2.CommandScheduler.resetInstance()
+    switchable_options.get_robot_specific_options.cache_clear()
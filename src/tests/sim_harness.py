@@ -0,0 +1,85 @@
+"""Deterministic lockstep simulation harness for command and OI tests.
+
+Simulated time is paused, so each cycle runs the command scheduler once and then advances the clock by exactly one
+robot period. Nothing waits on the wall clock, so N cycles run as fast as Python can execute them.
+"""
+
+from typing import Callable, Optional
+
+import commands2
+import wpilib
+from wpilib.simulation import DriverStationSim, PS4ControllerSim, SimHooks
+from wpimath.geometry import Pose2d
+from wpimath.kinematics import SwerveModuleState
+
+from config.global_options import DRIVER_JOYSTICK
+from container import RobotContainer
+
+
+def refresh_driver_station():
+    """Make values set on simulated controllers visible to the robot code"""
+    DriverStationSim.notifyNewData()
+    wpilib.DriverStation.refreshData()
+
+
+class LockstepSim:
+    """Run a RobotContainer one robot loop at a time in simulated time"""
+
+    PERIOD = 0.02
+
+    def __init__(self):
+        self.container = RobotContainer()
+        self.swerve = self.container.swerve
+        self.scheduler = commands2.CommandScheduler.getInstance()
+        self.controller = PS4ControllerSim(DRIVER_JOYSTICK)
+        self.cycle = 0
+
+        self.enable()
+
+    def enable(self, autonomous: bool = False):
+        DriverStationSim.setAutonomous(autonomous)
+        DriverStationSim.setEnabled(True)
+        refresh_driver_station()
+
+    def disable(self):
+        DriverStationSim.setEnabled(False)
+        refresh_driver_station()
+
+    def step(self, cycles: int = 1, inputs: Optional[Callable[[int, PS4ControllerSim], None]] = None):
+        """Run the robot for a number of loops
+
+        :param cycles: How many 20 ms loops to run
+        :param inputs: Called before each loop with the loop number (counting from 0) and the driver's controller, to
+            script joystick inputs
+        """
+        for i in range(cycles):
+            if inputs is not None:
+                inputs(i, self.controller)
+            refresh_driver_station()
+
+            # Same as Robot.robotPeriodic
+            start = wpilib.Timer.getFPGATimestamp()
+            self.scheduler.run()
+            self.container.dashboard.update(wpilib.Timer.getFPGATimestamp() - start)
+
+            SimHooks.stepTiming(self.PERIOD)
+            self.cycle += 1
+
+    def run_until(self, condition: Callable[[], bool], max_cycles: int = 500) -> int:
+        """Step until the condition is true and return the number of loops it took"""
+        for i in range(max_cycles):
+            if condition():
+                return i
+            self.step()
+        raise AssertionError(f"Condition was not met within {max_cycles} cycles")
+
+    @property
+    def module_states(self) -> tuple[SwerveModuleState, ...]:
+        return tuple(self.swerve.module_states)
+
+    @property
+    def pose(self) -> Pose2d:
+        return self.swerve.pose
+
+    def close(self):
+        self.container.dashboard.stop()
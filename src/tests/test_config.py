@@ -0,0 +1,75 @@
+import pytest
+
+from swervepy import u
+
+from config import robot_identity, switchable_options
+
+
+@pytest.fixture
+def identity(tmp_path, monkeypatch):
+    """Point robot identification at temporary files. Returns a function to set the roboRIO's serial number"""
+    monkeypatch.setattr(robot_identity, "ROBOT_SERIALS", {"ABC123": "1"})
+    monkeypatch.setattr(robot_identity, "ROBOT_ID_FILE", tmp_path / "robot_ROBOT_ID")
+    monkeypatch.setattr(robot_identity, "DEPLOYED_ROBOT_ID_FILE", tmp_path / "ROBOT_ID")
+
+    def set_serial(serial: str):
+        monkeypatch.setattr(robot_identity, "get_serial_number", lambda: serial)
+
+    set_serial("")
+    return set_serial
+
+
+def test_demo_2_inherits_demo_1():
+    demo_1 = switchable_options.resolve_options("2")
+    demo_2 = switchable_options.resolve_options("3")
+
+    assert issubclass(demo_2, demo_1)
+    assert demo_2.TRACK_WIDTH == pytest.approx((18.75 * u.inch).m_as(u.m))
+    assert demo_2.WHEEL_BASE == pytest.approx((18.75 * u.inch).m_as(u.m))
+    assert demo_2.DRIVE_PARAMS is demo_1.DRIVE_PARAMS
+    assert demo_2.AZIMUTH_PARAMS is demo_1.AZIMUTH_PARAMS
+    assert demo_2.AZIMUTH_PARAMS.kP == 0.01
+    assert demo_2.FALCON_AZIMUTH_PARAMS.kP == 0.3
+
+    # Hardware is declared separately for each robot
+    assert "GYRO" in vars(demo_2)
+    assert "MODULES" in vars(demo_2)
+
+
+def test_unknown_robot_id():
+    with pytest.raises(Exception, match="does not have a matching option set"):
+        switchable_options.resolve_options("does not exist")
+
+
+def test_deployed_robot_id_in_simulation(identity):
+    robot_identity.DEPLOYED_ROBOT_ID_FILE.write_text("4\n")
+
+    assert robot_identity.detect_robot_id() == "4"
+
+
+def test_no_robot_id(identity):
+    with pytest.raises(Exception, match="ROBOT_ID does not exist"):
+        robot_identity.detect_robot_id()
+
+
+def test_serial_number_wins_over_files(identity):
+    identity("ABC123")
+    robot_identity.ROBOT_ID_FILE.write_text("2")
+    robot_identity.DEPLOYED_ROBOT_ID_FILE.write_text("0")
+
+    assert robot_identity.detect_robot_id() == "1"
+
+
+def test_robot_file_wins_over_deployed_id(identity):
+    identity("UNKNOWN")
+    robot_identity.ROBOT_ID_FILE.write_text("2")
+    robot_identity.DEPLOYED_ROBOT_ID_FILE.write_text("0")
+
+    assert robot_identity.detect_robot_id() == "2"
+
+
+def test_unknown_robot_falls_back_to_deployed_id(identity):
+    identity("UNKNOWN")
+    robot_identity.DEPLOYED_ROBOT_ID_FILE.write_text("0")
+
+    assert robot_identity.detect_robot_id() == "0"
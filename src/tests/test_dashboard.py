@@ -0,0 +1,76 @@
+import ntcore
+import pytest
+from wpilib.simulation import SimHooks
+from wpimath.geometry import Pose2d
+
+from dashboard import DashboardPublisher
+
+
+def subtable(name: str) -> ntcore.NetworkTable:
+    return ntcore.NetworkTableInstance.getDefault().getTable("SmartDashboard").getSubTable(name)
+
+
+@pytest.fixture
+def publisher(sim):
+    publisher = DashboardPublisher(sim.swerve, 0.1, "Dashboard Test")
+    yield publisher
+    publisher.stop()
+
+
+def test_loop_time_covers_every_cycle(publisher):
+    table = subtable("Dashboard Test")
+    loop_time_max = table.getDoubleTopic("Loop Time Max (ms)").subscribe(-1)
+    loop_time_mean = table.getDoubleTopic("Loop Time Mean (ms)").subscribe(-1)
+
+    # The first update always takes a snapshot
+    publisher.update(0.001)
+    assert publisher.wait_until_sent(1)
+    assert loop_time_max.get() == pytest.approx(1)
+
+    # The overrun happens between snapshots, and still shows up in the next one
+    for loop_time in (0.002, 0.030, 0.004, 0.003, 0.002):
+        SimHooks.stepTiming(0.02)
+        publisher.update(loop_time)
+    assert publisher.wait_until_sent(1)
+
+    assert loop_time_max.get() == pytest.approx(30)
+    assert loop_time_mean.get() == pytest.approx(8.2)
+
+
+def test_unchanged_values_are_sent_once(publisher):
+    command = subtable("Dashboard Test").getStringTopic("Current Command").subscribe("")
+
+    for _ in range(3):
+        publisher.update(0.001)
+        SimHooks.stepTiming(0.1)
+        assert publisher.wait_until_sent(1)
+
+    assert len(command.readQueue()) == 1
+
+
+def test_sim_publishes_pose(sim):
+    pose = subtable("Swerve").getStructTopic("Pose", Pose2d).subscribe(Pose2d())
+
+    def drive_forward(cycle, controller):
+        controller.setLeftY(-1)
+
+    def release_sticks(cycle, controller):
+        controller.setLeftY(0)
+
+    sim.step(10, drive_forward)
+    # Stopped, so the snapshot taken during these cycles matches the final pose
+    sim.step(6, release_sticks)
+    assert sim.container.dashboard.wait_until_sent(1)
+
+    assert sim.pose.x > 0
+    assert pose.get().x == pytest.approx(sim.pose.x)
+    assert pose.get().y == pytest.approx(sim.pose.y)
+
+
+def test_stop_unpublishes_topics(sim):
+    publisher = DashboardPublisher(sim.swerve, 0.1, "Dashboard Stop Test")
+    topic = subtable("Dashboard Stop Test").getDoubleTopic("Loop Time Max (ms)")
+    assert topic.exists()
+
+    publisher.stop()
+    assert not topic.exists()
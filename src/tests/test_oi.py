@@ -0,0 +1,104 @@
+import pytest
+from wpilib.simulation import JoystickSim, PS4ControllerSim, XboxControllerSim
+
+from oi import PS4Driver, T16000M, XboxDriver, deadband
+from sim_harness import refresh_driver_station
+
+PORT = 0
+
+
+def xbox():
+    sim = XboxControllerSim(PORT)
+    return XboxDriver(PORT), {
+        "forward": sim.setLeftY,
+        "strafe": sim.setLeftX,
+        "turn": sim.setRightX,
+        "reset_gyro": sim.setStartButton,
+        "toggle_field_relative": sim.setBackButton,
+        "ski_stop": sim.setYButton,
+    }
+
+
+def ps4():
+    sim = PS4ControllerSim(PORT)
+    return PS4Driver(PORT), {
+        "forward": sim.setLeftY,
+        "strafe": sim.setLeftX,
+        "turn": sim.setRightX,
+        "reset_gyro": sim.setOptionsButton,
+        "toggle_field_relative": sim.setShareButton,
+        "ski_stop": sim.setTriangleButton,
+    }
+
+
+def t16000m():
+    sim = JoystickSim(PORT)
+    sim.setAxisCount(4)
+    sim.setButtonCount(16)
+    return T16000M(PORT), {
+        "forward": lambda value: sim.setRawAxis(1, value),
+        "strafe": lambda value: sim.setRawAxis(0, value),
+        "turn": lambda value: sim.setRawAxis(2, value),
+        "reset_gyro": lambda pressed: sim.setRawButton(8, pressed),
+        "toggle_field_relative": lambda pressed: sim.setRawButton(9, pressed),
+        "ski_stop": sim.setTrigger,
+    }
+
+
+SCHEMES = [xbox, ps4, t16000m]
+
+
+@pytest.fixture(params=SCHEMES, ids=lambda scheme: scheme.__name__)
+def scheme(request, driver_station):
+    return request.param()
+
+
+def test_deadband():
+    assert deadband(0.05, 0.08) == 0
+    assert deadband(-0.05, 0.08) == 0
+    assert deadband(0.5, 0.08) == 0.5
+    assert deadband(-0.5, 0.08) == -0.5
+
+
+def test_sticks_are_inverted(scheme):
+    driver, inputs = scheme
+    inputs["forward"](-1)
+    inputs["strafe"](-1)
+    inputs["turn"](-1)
+    refresh_driver_station()
+
+    assert driver.forward() == pytest.approx(1)
+    assert driver.strafe() == pytest.approx(1)
+    assert driver.turn() == pytest.approx(0.6)
+
+
+def test_small_stick_inputs_are_ignored(scheme):
+    driver, inputs = scheme
+    inputs["forward"](0.0005)
+    inputs["strafe"](-0.0005)
+    inputs["turn"](0.05)
+    refresh_driver_station()
+
+    assert driver.forward() == 0
+    assert driver.strafe() == 0
+    assert driver.turn() == 0
+    assert not driver.is_movement_commanded()
+
+
+def test_movement_commanded(scheme):
+    driver, inputs = scheme
+    inputs["strafe"](0.5)
+    refresh_driver_station()
+
+    assert driver.is_movement_commanded()
+
+
+@pytest.mark.parametrize("action", ["reset_gyro", "toggle_field_relative", "ski_stop"])
+def test_buttons(scheme, action):
+    driver, inputs = scheme
+    trigger = getattr(driver, action)
+    assert not trigger.getAsBoolean()
+
+    inputs[action](True)
+    refresh_driver_station()
+    assert trigger.getAsBoolean()
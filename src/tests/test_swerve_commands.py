@@ -0,0 +1,123 @@
+import math
+
+import pytest
+from wpimath.geometry import Rotation2d, Translation2d
+
+from commands.swerve import TurnCommand, drive_command, ski_stop_command, stop_command
+
+# Odometry can lag the wheels by one 20 ms cycle, which is 2 cm at 1 m/s
+DISTANCE_TOLERANCE = 0.02
+
+
+def module_velocity(state) -> Translation2d:
+    """Velocity of a module as a vector, so flipped-and-reversed states compare equal"""
+    return Translation2d(state.speed, state.angle)
+
+
+def assert_parallel(a: Translation2d, b: Translation2d):
+    assert a.x * b.y - a.y * b.x == pytest.approx(0, abs=1e-6)
+    assert a.x * b.x + a.y * b.y > 0
+
+
+def drive_forward(cycle, controller):
+    controller.setLeftY(-1)
+
+
+def release_sticks(cycle, controller):
+    controller.setLeftY(0)
+    controller.setLeftX(0)
+    controller.setRightX(0)
+
+
+def test_ski_stop_command_points_wheels_in_x(sim):
+    ski_stop_command(sim.swerve).schedule()
+    sim.step(3)
+
+    for state, angle in zip(sim.module_states, (45, 315, 315, 45)):
+        assert state.speed == pytest.approx(0)
+        # Points along the same line as the desired angle, in either direction
+        assert abs(math.sin((state.angle - Rotation2d.fromDegrees(angle)).radians())) == pytest.approx(0, abs=1e-6)
+
+
+@pytest.mark.parametrize("use_cache", [False, True])
+def test_drive_command_drives_forward(sim, use_cache):
+    cache = sim.container.module_state_cache if use_cache else None
+    command = drive_command(sim.swerve, 1, 0, 0, cache=cache)
+    command.addRequirements(sim.swerve)
+    command.schedule()
+    sim.step(10)
+
+    for state in sim.module_states:
+        assert_parallel(module_velocity(state), Translation2d(1, 0))
+    # 1 m/s for 10 cycles of 20 ms
+    assert sim.pose.x == pytest.approx(0.2, abs=DISTANCE_TOLERANCE)
+    assert sim.pose.y == pytest.approx(0, abs=1e-6)
+
+
+@pytest.mark.parametrize("use_cache", [False, True])
+def test_drive_command_strafes_from_rest(sim, use_cache):
+    # The wheels start at 0 degrees, so every module has to turn 90 degrees before it can drive
+    cache = sim.container.module_state_cache if use_cache else None
+    command = drive_command(sim.swerve, 0, 1, 0, cache=cache)
+    command.addRequirements(sim.swerve)
+    command.schedule()
+    sim.step(10)
+
+    for state in sim.module_states:
+        assert_parallel(module_velocity(state), Translation2d(0, 1))
+    # 1 m/s for 10 cycles of 20 ms
+    assert sim.pose.x == pytest.approx(0, abs=1e-6)
+    assert sim.pose.y == pytest.approx(0.2, abs=DISTANCE_TOLERANCE)
+
+
+def test_stop_command_stops_modules(sim):
+    command = drive_command(sim.swerve, 1, 0, 0)
+    command.addRequirements(sim.swerve)
+    command.schedule()
+    sim.step(5)
+
+    stop_command(sim.swerve).schedule()
+    sim.step(1)
+
+    for state in sim.module_states:
+        assert state.speed == pytest.approx(0)
+
+
+def test_turn_command_rotates_counterclockwise(sim):
+    command = TurnCommand(sim.swerve, Rotation2d.fromDegrees(90))
+    command.addRequirements(sim.swerve)
+    command.schedule()
+    sim.step(3)
+
+    # Rotating in place, every wheel moves perpendicular to its placement
+    for state, module in zip(sim.module_states, sim.container.options.MODULES):
+        placement = module.placement
+        assert_parallel(module_velocity(state), Translation2d(-placement.y, placement.x))
+
+    sim.run_until(lambda: abs(sim.swerve.heading.degrees() - 90) < 0.5)
+    sim.step(25)
+    assert sim.swerve.heading.degrees() == pytest.approx(90, abs=0.5)
+
+
+def test_teleop_follows_joystick(sim):
+    sim.step(10, drive_forward)
+
+    for state in sim.module_states:
+        assert_parallel(module_velocity(state), Translation2d(1, 0))
+    # Full stick is the dummy robot's max velocity of 4 m/s, for 10 cycles of 20 ms
+    assert sim.pose.x == pytest.approx(0.8, abs=4 * DISTANCE_TOLERANCE)
+
+    sim.step(1, release_sticks)
+    for state in sim.module_states:
+        assert state.speed == pytest.approx(0)
+
+
+def test_ski_stop_button_cancels_when_driving(sim):
+    def press_ski_stop(cycle, controller):
+        controller.setTriangleButton(cycle == 0)
+
+    sim.step(3, press_ski_stop)
+    assert sim.swerve.getCurrentCommand() is not sim.container.teleop_command
+
+    sim.step(3, drive_forward)
+    assert sim.swerve.getCurrentCommand() is sim.container.teleop_command